@@ -63,15 +63,22 @@ See [SV2013]_, [BMS2006]_, and [SS1983]_.
 from sage.structure.sage_object import SageObject
 from sage.matrix.constructor import matrix
 from sage.modules.free_module_element import vector
+from sage.rings.polynomial.polynomial_ring_constructor import PolynomialRing
 from sage.rings.number_field.number_field import QuadraticField
 from sage.rings.finite_rings.integer_mod_ring import Integers
 from sage.rings.finite_rings.finite_field_constructor import GF
 from sage.rings.integer import Integer
+from sage.rings.integer_ring import ZZ
 from sage.arith.functions import lcm
-from sage.arith.misc import is_prime, next_prime, next_prime_power, legendre_symbol
+from sage.arith.misc import CRT_list, is_prime, next_prime, next_prime_power, legendre_symbol
 from sage.functions.log import log
 from sage.misc.functional import sqrt
 
+# The characteristic polynomials of all binary recurrence sequences live in
+# ZZ['x']; bind the ring once at import time rather than looking it up in
+# the PolynomialRing cache for every constructed sequence.
+_ZZX = PolynomialRing(ZZ, 'x')
+
 
 class BinaryRecurrenceSequence(SageObject):
 
@@ -123,10 +130,25 @@ class BinaryRecurrenceSequence(SageObject):
             True
 
         """
-        self.b = b
-        self.c = c
-        self.u0 = u0
-        self.u1 = u1
+        # Box the defining data as Sage Integers once, so the arithmetic in
+        # the methods below never re-coerces raw Python ints.
+        self.b = Integer(b)
+        self.c = Integer(c)
+        self.u0 = Integer(u0)
+        self.u1 = Integer(u1)
+        b, c = self.b, self.c
+        # The characteristic polynomial x^2 - b*x - c and the companion
+        # matrix of the recurrence are built once here; __call__ and period
+        # only coerce them into the ring they need.
+        self._charpoly_coeffs = (-c, -b, 1)
+        self._charpoly = _ZZX(list(self._charpoly_coeffs))
+        self._F = matrix(ZZ, [[0, 1], [c, b]])
+        self._F.set_immutable()
+        # lazily-built cache for the ZZ path of __call__: the generator of
+        # ZZ['x'] (FLINT), the characteristic polynomial in it, and the
+        # initial conditions.  Nonzero moduli never reach it -- they are
+        # handled by the hand-rolled machine-int paths.
+        self._zz_data = None
         self._period_dict = {}  # dictionary to cache the period of a sequence for future lookup
         self._PGoodness = {}  # dictionary to cache primes that are "good" by some prime power
         self._ell = 1  # variable that keeps track of the last prime power to be used as a goodness
@@ -162,7 +184,22 @@ class BinaryRecurrenceSequence(SageObject):
         """
         return (self.u0 == other.u0) and (self.u1 == other.u1) and (self.b == other.b) and (self.c == other.c)
 
-    def __call__(self, n, modulus=0):
+    def __hash__(self):
+        """
+        Hash a binary recurrence sequence by its defining data.
+
+        EXAMPLES::
+
+            sage: R = BinaryRecurrenceSequence(3,3,2,1)
+            sage: S = BinaryRecurrenceSequence(3,3,2,1)
+            sage: hash(R) == hash(S)
+            True
+            sage: len({R, S, BinaryRecurrenceSequence(1,1)})
+            2
+        """
+        return hash((self.b, self.c, self.u0, self.u1))
+
+    def __call__(self, n, modulus=0, use_crt=False):
         """
         Give the nth term of a binary recurrence sequence, possibly mod some modulus.
 
@@ -172,6 +209,12 @@ class BinaryRecurrenceSequence(SageObject):
 
         - ``modulus`` -- a natural number (optional --  default value is 0)
 
+        - ``use_crt`` -- boolean (optional -- default ``False``); if ``True``
+          and ``modulus`` is composite, compute the term modulo each prime
+          power dividing ``modulus`` separately and recombine by the Chinese
+          Remainder Theorem.  Worthwhile when ``modulus`` is large but its
+          prime power factors are small (and cheap to find)
+
         OUTPUT:
 
         - An integer (the nth term of the binary recurrence sequence modulo ``modulus``)
@@ -187,12 +230,307 @@ class BinaryRecurrenceSequence(SageObject):
             9
             sage: R(101)%12
             9
+            sage: R(10**6, 10**9)        # fast even for very large indices
+            173671877
+            sage: R(10**4, 7*11*13*101, use_crt=True)
+            60905
+            sage: R(10**4, 7*11*13*101)
+            60905
+
+        Once the period modulo ``modulus`` has been computed (and so
+        cached), huge indices are reduced modulo the period first::
+
+            sage: R.period(5)
+            4
+            sage: R(10**30, 5)
+            2
+        """
+        n = Integer(n)
+        if 0 <= n <= 1:
+            # just the initial conditions; no ring machinery needed
+            u = self.u0 if n == 0 else self.u1
+            return u if modulus == 0 else Integers(modulus)(u)
+        if use_crt and modulus > 1:
+            return self._call_crt(n, modulus)
+        if modulus > 1 and n > 1:
+            # If the period mod `modulus` is already known, the sequence
+            # repeats with that period, so reduce the index before doing
+            # any real work.  The period is not computed here -- that can
+            # be costlier than the exponentiation -- only reused.
+            period = self._period_dict.get(modulus)
+            if period is not None and n >= period:
+                n = n % period
+        # Integers(0) is ZZ, but going through the IntegerModRing factory
+        # and generic coercion costs more than this branch.
+        R = ZZ if modulus == 0 else Integers(modulus)
+        if n < 0:
+            # Fall back to the companion matrix, which handles inverting the
+            # recurrence when it is possible at all.
+            F = self._F if R is ZZ else self._F.change_ring(R)
+            # F*[u_{n}, u_{n+1}]^T = [u_{n+1}, u_{n+2}]^T (T indicates transpose).
+            # Only the first entry of F^n * [u_0, u_1]^T is wanted, so dot
+            # the first row of F^n with the initial conditions instead of
+            # building the full product vector.
+            M = F**n
+            return M[0, 0] * R(self.u0) + M[0, 1] * R(self.u1)
+        if n < 128:
+            # For small indices, iterating the recurrence itself -- one
+            # multiply-add per step on a rolling pair of values -- beats the
+            # setup cost of the polynomial exponentiation below.
+            if modulus:
+                # Working with plain Python ints and reducing after each step
+                # skips the overhead of creating an IntegerMod element per
+                # iteration.
+                m = int(modulus)
+                x, y = int(self.u0) % m, int(self.u1) % m
+                b, c = int(self.b) % m, int(self.c) % m
+                for _ in range(n):
+                    x, y = y, (b * y + c * x) % m
+                return R(x)
+            x, y = R(self.u0), R(self.u1)
+            b, c = R(self.b), R(self.c)
+            for _ in range(n):
+                x, y = y, b * y + c * x
+            return x
+        # Fiduccia's algorithm: as u_n is determined by the recurrence, if
+        # x^n = p_0 + p_1*x modulo the characteristic polynomial x^2 - b*x - c
+        # of the recurrence, then u_n = p_0*u_0 + p_1*u_1.  Computing x^n by
+        # repeated squaring of polynomials of degree < 2 replaces the 2x2
+        # matrix power, saving a constant factor of ring multiplications.
+        if modulus:
+            # Over Z/mZ, run the square-and-multiply by hand on the plain-int
+            # coefficient pair (p_0, p_1): squaring reduced by x^2 = b*x + c
+            # costs four multiplications per doubling, fewer than the generic
+            # polynomial pow and with no Sage element overhead.
+            m = int(modulus)
+            b, c = int(self.b) % m, int(self.c) % m
+            p0, p1 = 1, 0
+            for bit in bin(int(n))[2:]:
+                sq = p1 * p1
+                p0, p1 = (p0 * p0 + c * sq) % m, (2 * p0 * p1 + b * sq) % m
+                if bit == '1':
+                    p0, p1 = (c * p1) % m, (p0 + b * p1) % m
+            return R((p0 * int(self.u0) + p1 * int(self.u1)) % m)
+        # Only the ZZ case reaches this point (the modular branch above
+        # returns for every nonzero modulus), so a single lazily-built
+        # tuple suffices: the polynomial generator, the characteristic
+        # polynomial and the initial conditions.
+        data = self._zz_data
+        if data is None:
+            # Ask for the FLINT implementation explicitly: fmpz_poly
+            # powering switches to FFT-based (Kronecker substitution)
+            # multiplication on its own once the big-integer coefficients
+            # grow past its threshold.
+            S = PolynomialRing(ZZ, 'x', implementation='FLINT')
+            data = (S.gen(), S(list(self._charpoly_coeffs)),
+                    self.u0, self.u1)
+            self._zz_data = data
+        xn = pow(data[0], n, data[1])
+        p0, p1 = xn.padded_list(2)
+        return p0 * data[2] + p1 * data[3]
+
+    def _call_crt(self, n, m):
+        """
+        Return the nth term of the sequence modulo ``m`` by splitting the
+        computation over the prime power factors of ``m`` and recombining
+        with the Chinese Remainder Theorem.
+
+        Each prime power computation stays in small modular arithmetic, so
+        for a large composite ``m`` with small factors this avoids doing the
+        whole exponentiation with big modular integers.
+
+        INPUT:
+
+        - ``n`` -- a nonnegative integer
+
+        - ``m`` -- an integer greater than 1 (the modulus)
+
+        OUTPUT:
+
+        - The nth term of the sequence, as an element of ``Integers(m)``.
+
+        EXAMPLES::
+
+            sage: R = BinaryRecurrenceSequence(3,3,2,1)
+            sage: R._call_crt(100, 100)
+            77
+            sage: R._call_crt(100, 100) == R(100, 100)
+            True
+        """
+        m = Integer(m)
+        moduli = [p**e for p, e in m.factor()]
+        if len(moduli) == 1:
+            return self(n, m)
+        residues = [Integer(self(n, q)) for q in moduli]
+        return Integers(m)(CRT_list(residues, moduli))
+
+    def _iter_terms(self, N, modulus=0):
+        """
+        Return the list of terms `u_0, u_1, ..., u_{N-1}`, possibly mod some modulus.
+
+        The terms are produced by a single forward sweep of the recurrence,
+        one multiply-add per term, so computing `N` consecutive terms this
+        way is much cheaper than `N` independent calls.
+
+        INPUT:
+
+        - ``N`` -- a natural number (how many terms to produce)
+
+        - ``modulus`` -- a natural number (optional -- default value is 0)
+
+        OUTPUT:
+
+        - The list of the first ``N`` terms of the sequence modulo ``modulus``.
+
+        EXAMPLES::
+
+            sage: R = BinaryRecurrenceSequence(3,3,2,1)
+            sage: R._iter_terms(7)
+            [2, 1, 9, 30, 117, 441, 1674]
+            sage: R._iter_terms(7, 10)
+            [2, 1, 9, 0, 7, 1, 4]
+            sage: R._iter_terms(7, 10) == [R(k, 10) for k in range(7)]
+            True
+        """
+        R = ZZ if modulus == 0 else Integers(modulus)
+        if modulus:
+            # plain machine-int arithmetic, as in the iterative path of
+            # __call__
+            m = int(modulus)
+            x, y = int(self.u0) % m, int(self.u1) % m
+            b, c = int(self.b) % m, int(self.c) % m
+            terms = []
+            for _ in range(N):
+                terms.append(x)
+                x, y = y, (b * y + c * x) % m
+            return [R(t) for t in terms]
+        x, y = R(self.u0), R(self.u1)
+        terms = []
+        for _ in range(N):
+            terms.append(x)
+            x, y = y, self.b * y + self.c * x
+        return terms
+
+    def characteristic_polynomial(self):
+        """
+        Return the characteristic polynomial `x^2 - bx - c` of the
+        recurrence relation, as a polynomial over the integers.
+
+        The terms of the sequence satisfy `u_{n+2} - b u_{n+1} - c u_n = 0`,
+        so the sequence is annihilated by its characteristic polynomial.
+
+        EXAMPLES::
+
+            sage: R = BinaryRecurrenceSequence(3,3,2,1)
+            sage: R.characteristic_polynomial()
+            x^2 - 3*x - 3
+
+            sage: S = BinaryRecurrenceSequence(1,1)
+            sage: S.characteristic_polynomial()
+            x^2 - x - 1
+        """
+        return self._charpoly
+
+    def terms(self, N, modulus=0):
+        """
+        Return the first ``N`` terms of the sequence, possibly mod some modulus.
+
+        The terms come from a single forward sweep of the recurrence, so
+        this is much faster than calling the sequence at each index in
+        turn, which would redo a full exponentiation per term.
+
+        INPUT:
+
+        - ``N`` -- a natural number (how many terms to return)
+
+        - ``modulus`` -- a natural number (optional -- default value is 0)
+
+        OUTPUT:
+
+        - The list `[u_0, u_1, ..., u_{N-1}]` of terms modulo ``modulus``.
+
+        EXAMPLES::
+
+            sage: R = BinaryRecurrenceSequence(3,3,2,1)
+            sage: R.terms(7)
+            [2, 1, 9, 30, 117, 441, 1674]
+            sage: R.terms(7, 10)
+            [2, 1, 9, 0, 7, 1, 4]
+            sage: R.terms(7, 10) == [R(k, 10) for k in range(7)]
+            True
+        """
+        return self._iter_terms(N, modulus)
+
+    def minimal_polynomial(self):
+        """
+        Return the minimal polynomial of the recurrence sequence.
+
+        This is the monic polynomial of least degree annihilating the
+        sequence, as an element of `\\ZZ['x']`.  It has strictly smaller
+        degree than the characteristic polynomial exactly when the sequence
+        also satisfies a shorter recurrence (for instance when it is
+        geometric).
+
+        EXAMPLES::
+
+            sage: R = BinaryRecurrenceSequence(3,3,2,1)
+            sage: R.minimal_polynomial()
+            x^2 - 3*x - 3
+
+            sage: S = BinaryRecurrenceSequence(2,0,1,2)
+            sage: S.is_geometric()
+            True
+            sage: S.minimal_polynomial()
+            x - 2
+
+        A quasigeometric sequence has a transient start, so its minimal
+        polynomial keeps a factor of `x`::
+
+            sage: T = BinaryRecurrenceSequence(3,0)
+            sage: T.terms(5)
+            [0, 1, 3, 9, 27]
+            sage: T.minimal_polynomial()
+            x^2 - 3*x
+            sage: BinaryRecurrenceSequence(0,0,1,2).minimal_polynomial()
+            x^2
+        """
+        from sage.matrix.berlekamp_massey import berlekamp_massey
+        # Berlekamp-Massey needs the first 4 terms, which one forward sweep
+        # of the recurrence produces; no exponentiation is involved.
+        terms = self._iter_terms(4)
+        g = _ZZX(berlekamp_massey(terms))
+        # berlekamp_massey returns the reversed denominator of the rational
+        # generating function.  When c = 0 the sequence can have a transient
+        # start that only the numerator sees (0, 1, 3, 9, ... satisfies no
+        # first-order recurrence even though its tail is geometric), so the
+        # returned polynomial need not annihilate the whole sequence.
+        # Multiplying by x shifts past the transient; repeat until every
+        # window of the computed terms is annihilated.
+        d = g.degree()
+        while any(sum(g[i] * terms[k + i] for i in range(d + 1))
+                  for k in range(len(terms) - d)):
+            g = g.shift(1)
+            d += 1
+        return g
+
+    def transformation_matrix(self):
+        """
+        Return the companion matrix `F = [[0,1],[c,b]]` of the recurrence
+        relation, over the integers.
+
+        This is the matrix stepping the sequence forward:
+        `F \\cdot [u_n, u_{n+1}]^T = [u_{n+1}, u_{n+2}]^T`.
+
+        EXAMPLES::
+
+            sage: R = BinaryRecurrenceSequence(3,3,2,1)
+            sage: F = R.transformation_matrix(); F
+            [0 1]
+            [3 3]
+            sage: F * vector([R(0), R(1)]) == vector([R(1), R(2)])
+            True
         """
-        R = Integers(modulus)
-        F = matrix(R, [[0, 1], [self.c, self.b]])
-        # F*[u_{n}, u_{n+1}]^T = [u_{n+1}, u_{n+2}]^T (T indicates transpose).
-        v = vector(R, [self.u0, self.u1])
-        return list(F**n * v)[0]
+        return self._F
 
     def is_degenerate(self):
         """
@@ -403,7 +741,7 @@ class BinaryRecurrenceSequence(SageObject):
 
         else:
             R = Integers(m)
-            A = matrix(R, [[0, 1], [self.c, self.b]])
+            A = self._F.change_ring(R)
             w = vector(R, [self.u0, self.u1])
             Fac = list(m.factor())
             Periods = {}